@@ -58,7 +58,6 @@ def run(cmd: MutableSequence, working_dir: Path, log_file: str, **kwargs):
     with open(log_file, "w") as log_file:
         subprocess.run(
             cmd,
-            text=True,
             check=True,
             cwd=working_dir,
             stdout=log_file,